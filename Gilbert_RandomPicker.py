@@ -5,17 +5,33 @@ Description:
 """
 ####imports and variable setup####
 import random
+from collections import deque
 import tsapp
 
-choosing_class = True
+## the main loop polls the mouse every frame, so bind the tsapp input functions once
+_was_pressed = tsapp.was_mouse_pressed
+_mouse_pos = tsapp.get_mouse_position
+
+## the main loop is in exactly one of these states: choosing a class period,
+## choosing names from the chosen class, or waiting for a reset after saving
+STATE_CHOOSE = 0
+STATE_NAMING = 1
+STATE_SAVED = 2
+state = STATE_CHOOSE
 chosen_period = 0
 files = ["first.txt", "second.txt", "third.txt", "fifth.txt", "sixth.txt", "seventh.txt"]
 eaton_green = (118, 190, 67)
 eaton_blue = (14, 35, 62)
 title_size = 100
+## characters trimmed from both ends of every name read from a roster file
+_STRIP_CHARS = ".,-;!@#$%^&* \t\r\n"
 choices = []
-drums = tsapp.Sound("Drumroll.mp3", unique = True, looping = False)
-crash = tsapp.Sound("Drum3.mp3", unique = True, looping = False)
+## the name waiting to be revealed once the drum roll finishes, or None when no drum roll is playing
+pending_student = None
+## a private random generator so draws don't share the global random module state
+_rng = random.Random()
+## sounds are loaded the first time they are played, see _get_sound
+_sounds = {}
 
 #### Function Definitions ####
 def load_class(filename):
@@ -32,34 +48,82 @@ def load_class(filename):
            white space or special characters at the beginning or the end
     """
     
-    with open(filename) as file:
-        class_list = file.readlines()
-        for i in range(len(class_list)-1, -1,-1):
-            if class_list[i].isspace():
-                del(class_list[i])
-            else:
-                class_list[i] = class_list[i].strip(".,-;!@#$%^&* ")
-    return class_list
+    with open(filename, "rb", buffering=65536) as file:
+        data = file.read()
+    ## rosters are normally UTF-8 (with or without a byte order mark).  older rosters saved by
+    ## Windows programs are usually cp1252; latin-1 can decode any bytes at all, so no roster
+    ## fails to load and no names are changed or lost
+    try:
+        raw = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        try:
+            raw = data.decode("cp1252")
+        except UnicodeDecodeError:
+            raw = data.decode("latin-1")
+    return [name for name in (line.strip(_STRIP_CHARS) for line in raw.splitlines()) if name]
                 
                     
 def get_next(choices_list):
-    """ a function that gets a random choice from a list and then removes the choice from that list
+    """ a function that gets the next random choice from a shuffled deque and then removes the choice from that deque
     
     PARAMETER:
     ----------
-    choices_list(list): the list from which to choose a random item.  The item chosen will be removed
-                        from the list as a function side-effect
+    choices_list(deque): the deque from which to choose an item.  Its contents must already be shuffled
+                         (see _rng.shuffle).  The item chosen will be removed from the front of the deque
+                         as a function side-effect
                       
     RETURN:
     -------
-    choice:  the item chosen from and removed from the list.
+    choice:  the item chosen from and removed from the deque, or None if the deque is empty.
     """
 
-    choice = None
-    if len(choices_list) > 0:
-        choice = random.choice(choices_list)
-        choices_list.remove(choice)
-    return choice
+    return choices_list.popleft() if choices_list else None
+
+
+def _get_sound(filename):
+    """ a function that returns the sound for a file, loading it the first time it is requested
+    
+    PARAMETER:
+    ----------
+    filename(string): the sound file to load
+                      
+    RETURN:
+    -------
+    tsapp.Sound:  the same sound object for every call with the same filename
+    """
+
+    sound = _sounds.get(filename)
+    if sound is None:
+        sound = tsapp.Sound(filename, unique = True, looping = False)
+        _sounds[filename] = sound
+    return sound
+
+
+def _set_visible(sprites, visible):
+    """ a function that shows or hides every graphical object in a group
+    
+    PARAMETER:
+    ----------
+    sprites(list): the graphical objects to update
+    visible(bool): True to show the objects, False to hide them
+    """
+
+    for sprite in sprites:
+        sprite.visible = visible
+
+
+def _show_state(new_state):
+    """ a function that shows exactly the icons and buttons used by a state of the main loop
+    
+    PARAMETER:
+    ----------
+    new_state(int): one of STATE_CHOOSE, STATE_NAMING or STATE_SAVED
+    """
+
+    icons_visible = _VISIBILITY[new_state]
+    for icon, visible in zip(_state_icons, icons_visible):
+        icon.visible = visible
+    _set_visible(buttons, icons_visible[-1])
 
 
 ####Create Graphics for Background and Title####
@@ -97,6 +161,12 @@ for i in range(len(button_files)):
     buttons.append(temp)
     window.add_object(temp)
 
+## the buttons never move and sit on one row at a fixed stride, so a click can be mapped
+## straight to a button index with arithmetic instead of testing every button
+_stride = button_width + offset
+_btn_y0 = int(buttons[0].y)
+_btn_y1 = _btn_y0 + buttons[0].height
+
 
 
 ####Name Choice text setup####
@@ -131,83 +201,75 @@ reset_icon.visible = False
 ## all of the above icons are set to be initially invisible.  The main graphics loop will show them
 ## at the appropriate time
 
+##which icons each state of the main loop shows, in the order
+##(next_icon, save_icon, name_label, reset_icon, period buttons)
+_state_icons = (next_icon, save_icon, name_label, reset_icon)
+_VISIBILITY = {
+    STATE_CHOOSE: (False, False, False, False, True),
+    STATE_NAMING: (True, True, True, False, False),
+    STATE_SAVED: (False, False, False, True, False),
+}
+
 #### Main program control loop will continue until the user presses the red x to close the window
+## each pass handles the input for the current state, then draws exactly one frame
 while window.is_running:
+    ##read this frame's mouse press once so a single click is only handled by one state
+    clicked = _was_pressed()
+    mouse_x, mouse_y = _mouse_pos() if clicked else (0, 0)
+
     ### This section will run when the user has not yet chosen a class period
-    if choosing_class:
-        ##hide all unnecessary icons
-        next_icon.visible = False
-        save_icon.visible = False
-        name_label.visible = False
-
-        window.finish_frame()
-        ##check for a mouse press during this frame and store the position
-        if tsapp.was_mouse_pressed():
-            mouse_x, mouse_y = tsapp.get_mouse_position()
-            
+    if state == STATE_CHOOSE:
+        ##check for a mouse press during this frame
+        if clicked:
             #Determine which button was clicked and store the index of the chosen period
-            for i in range(len(buttons)):
-                if buttons[i].is_colliding_point(mouse_x, mouse_y):
+            if _btn_y0 <= mouse_y < _btn_y1:
+                i, remainder = divmod(mouse_x - start_x, _stride)
+                if 0 <= i < len(buttons) and remainder < button_width:
                     chosen_period = i
-                    choosing_class = False
-            if not choosing_class:
-                for button in buttons:
-                    button.visible = False
-                window.finish_frame()
-    
-
-        ##read the file for the chosen class period
-        choices = load_class(files[chosen_period])
-    
+                    ##read the file for the chosen class period and shuffle it once
+                    ##so names can be drawn off the front in order
+                    roster = load_class(files[chosen_period])
+                    _rng.shuffle(roster)
+                    choices = deque(roster)
+                    state = STATE_NAMING
+                    _show_state(state)
     
     ###Class is chosen, this section begins name selection for the chosen class
-    if not choosing_class:
-        ##show necessary icons
-        next_icon.visible = True
-        save_icon.visible = True
-        name_label.visible = True
-        window.finish_frame()
-        
-        ##check for a mouse press during this frame and store the position
-        if tsapp.was_mouse_pressed():
-            mouse_x, mouse_y = tsapp.get_mouse_position()
+    elif state == STATE_NAMING:
+        ##while the drum roll plays, keep drawing frames and ignore clicks.  once it has
+        ##finished, reveal the chosen name with a crash
+        if pending_student != None:
+            if _get_sound("Drumroll.mp3").get_num_copies() == 0:
+                name_label.text = pending_student
+                pending_student = None
+                _get_sound("Drum3.mp3").play()
+        ##check for a mouse press during this frame
+        elif clicked:
             #if the next icon is selected, use the get_next function to get a name
-            #and update the name_label text property
+            #and start the drum roll; the name_label text is updated when it ends
             if next_icon.is_colliding_point(mouse_x, mouse_y):
                 student = get_next(choices)
                 if student != None:
-                    name_label.text = student
-                    drums.play()
-                    while drums.get_num_copies() > 0:
-                        pass
-                    crash.play()
-                    window.finish_frame()
+                    pending_student = student
+                    _get_sound("Drumroll.mp3").play()
                 else:
                     name_label.text = "All Students Have Been Chosen"
             #if the save icon is selected, update the contents of the .txt file with what
-            #is remaining of the choices list.  Hide appropriate icons and show the reset icon
+            #is remaining of the choices list and move on to the reset icon
             elif save_icon.is_colliding_point(mouse_x, mouse_y):
-                with open(files[chosen_period], "w") as file:
-                    print(*choices, sep="", file = file)
-                next_icon.visible = False
-                save_icon.visible = False
-                name_label.visible = False
-                reset_icon.visible = True
-                window.finish_frame()
+                with open(files[chosen_period], "w", encoding="utf-8", buffering=65536, newline="") as file:
+                    file.write("\n".join(choices))
+                    file.write("\n")
+                state = STATE_SAVED
+                _show_state(state)
 
     ### This section occurs when the file has been saved and gives the user a chance to reset and go back to class selection    
-    if reset_icon.visible:
-        ##check for a mouse press during this frame and store the position
-        if tsapp.was_mouse_pressed():
-            mouse_x, mouse_y = tsapp.get_mouse_position()
-            #changes the choosing_class boolean back to true, hides unecessary icons, and shows the buttons again
+    elif state == STATE_SAVED:
+        ##check for a mouse press during this frame
+        if clicked:
+            #returns to class selection and shows the buttons again
             if reset_icon.is_colliding_point(mouse_x, mouse_y):
-                reset_icon.visible = False
-                choosing_class = True
-                for button in buttons:
-                    button.visible = True
-                    
-                window.finish_frame()
-            
-            
-        
\ No newline at end of file
+                state = STATE_CHOOSE
+                _show_state(state)
+
+    window.finish_frame()
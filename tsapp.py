@@ -23,11 +23,15 @@ from __future__ import division
 #
 #       For rarely used imports consider the use of local imports instead.
 import json
+import os
 import pygame
-import pygame.freetype
 import sys
+from functools import lru_cache
 
-pygame.init()
+# NOTE: pygame.init() enumerates every SDL subsystem and can be slow, so it is
+#       deferred until something actually needs it (see _init_pygame), and
+#       pygame.freetype is only imported once a TextLabel is created
+#       (see _get_freetype).
 
 
 try:
@@ -52,9 +56,13 @@ if TYPE_CHECKING:
 if not hasattr(sys, 'tsk_query_ui'):  # if not DPython
     _query_ui = None  # type: Optional[Callable]
 else:
+    # Compact separators: pixel arrays sent to the platform hold one value per
+    # channel, so dropping the default ", " padding shrinks payloads considerably
+    _query_ui_separators = (',', ':')
+
     def _query_ui(command, args):
         # Assumes that PyGame has been initialized
-        return json.loads(sys.tsk_query_ui('pygame:' + command + ':' + json.dumps(args)))
+        return json.loads(sys.tsk_query_ui('pygame:' + command + ':' + json.dumps(args, separators=_query_ui_separators)))
 
 
 # ------------------------------------------------------------------------------
@@ -161,6 +169,28 @@ captions_short = False
 # Global current window; helpful to keep track of the currently-open window
 _active_window = None
 
+_pygame_initialized = False
+_freetype = None
+
+
+# Initializes pygame on first use
+def _init_pygame():
+    global _pygame_initialized
+    if not _pygame_initialized:
+        pygame.init()
+        _pygame_initialized = True
+
+
+# Returns the pygame.freetype module, importing and initializing it on first use
+def _get_freetype():
+    global _freetype
+    if _freetype is None:
+        import pygame.freetype
+        _init_pygame()
+        pygame.freetype.init()
+        _freetype = pygame.freetype
+    return _freetype
+
 
 # ------------------------------------------------------------------------------
 # Graphics
@@ -169,6 +199,75 @@ _active_window = None
 # automatically wiped after processing, so this allows querying
 _current_frame_event_list = []  # type: List[Any]
 
+# Keyboard state for the current frame, from pygame.key.get_pressed(); reset when
+# each frame's events are captured and fetched again the first time it is needed
+_current_frame_pressed_keys = None
+
+# Keys pressed and released, and whether a mouse button was pressed or released,
+# during the current frame; built from the event list by _capture_frame_events
+_current_frame_key_downs = set()
+_current_frame_key_ups = set()
+_current_frame_mouse_down = False
+_current_frame_mouse_up = False
+
+
+# Captures the current frame's events and sorts out the key and mouse button events,
+# so that the was_* functions do not each scan the whole event list
+def _capture_frame_events():
+    global _current_frame_event_list, _current_frame_pressed_keys
+    global _current_frame_key_downs, _current_frame_key_ups
+    global _current_frame_mouse_down, _current_frame_mouse_up
+
+    _current_frame_event_list = pygame.event.get()
+    _current_frame_pressed_keys = None
+
+    key_downs = set()
+    key_ups = set()
+    mouse_down = mouse_up = False
+    keydown_type = pygame.KEYDOWN
+    keyup_type = pygame.KEYUP
+    mousebuttondown_type = pygame.MOUSEBUTTONDOWN
+    mousebuttonup_type = pygame.MOUSEBUTTONUP
+    for event in _current_frame_event_list:
+        event_type = event.type
+        if event_type == keydown_type:
+            key_downs.add(event.key)
+        elif event_type == keyup_type:
+            key_ups.add(event.key)
+        elif event_type == mousebuttondown_type:
+            mouse_down = True
+        elif event_type == mousebuttonup_type:
+            mouse_up = True
+
+    _current_frame_key_downs = key_downs
+    _current_frame_key_ups = key_ups
+    _current_frame_mouse_down = mouse_down
+    _current_frame_mouse_up = mouse_up
+
+
+# Whether each GraphicalObject class's _draw takes the surface to draw onto. Classes
+# written before _draw took a surface define _draw(self) and draw onto the active
+# window's surface themselves, so finish_frame calls them without one.
+_draw_takes_surface = {}
+
+
+def _get_draw_takes_surface(object_class):
+    takes_surface = _draw_takes_surface.get(object_class)
+    if takes_surface is None:
+        import inspect  # Local import: only needed once per GraphicalObject class
+
+        try:
+            parameters = list(inspect.signature(object_class._draw).parameters.values())
+        except (TypeError, ValueError):  # No signature available; assume the current form
+            takes_surface = True
+        else:
+            takes_surface = len(parameters) >= 2 or any(
+                parameter.kind == parameter.VAR_POSITIONAL for parameter in parameters
+            )
+        _draw_takes_surface[object_class] = takes_surface
+    return takes_surface
+
+
 class GraphicsWindow(object):
     """
     A window, into which drawable objects can be added and managed.
@@ -177,6 +276,7 @@ class GraphicsWindow(object):
     """
 
     def __init__(self, width=1018, height=573, background_color=WHITE):
+        _init_pygame()
 
         # Private variables
         self._surface = pygame.display.set_mode([width, height])
@@ -188,6 +288,11 @@ class GraphicsWindow(object):
         self.framerate = 30
 
         self._draw_list = []
+        self._index_map = {}  # id(drawable object) -> its position in _draw_list
+
+        # Dirty rectangle tracking for finish_frame
+        self._carried_dirty_rects = []
+        self._background_changed = True
 
         # Public variables
         self.is_running = True
@@ -197,6 +302,17 @@ class GraphicsWindow(object):
         _active_window = self
 
     # === Properties === #
+    def _get_background_color(self):
+        return self._background_color
+
+    def _set_background_color(self, background_color):
+        # Map the color to a pixel value once instead of on every frame's fill
+        self._background_mapped = self._surface.map_rgb(background_color)
+        self._background_color = background_color
+        self._background_changed = True
+
+    background_color = property(_get_background_color, _set_background_color)
+
     @property
     def width(self):
         return self._width
@@ -227,74 +343,77 @@ class GraphicsWindow(object):
             raise TypeError(
                 str(drawable_object) + " of type " + str(type(drawable_object)) + " cannot be added to the GraphicsWindow. Requires a GraphicalObject such as Sprite or TextLabel."
             )
+        self._index_map[id(drawable_object)] = len(self._draw_list)
         self._draw_list.append(drawable_object)
         # Note: instead of "remove_object", use
         # GraphicalObject.destroy() to remove an object
 
     # === Layers ===
 
-    def move_forward(self, drawable_object):
-        # NOTE: Would prefer to use list.find, but this does not
-        # seem to be available in Python 2.X
-        if drawable_object not in self._draw_list:
+    # Refreshes the position of every object in _draw_list from index start onwards.
+    # Should be called after any change that shifts objects within _draw_list.
+    def _reindex_draw_list(self, start=0):
+        draw_list = self._draw_list
+        index_map = self._index_map
+        for i in range(start, len(draw_list)):
+            index_map[id(draw_list[i])] = i
+
+    # Returns the layer index of drawable_object, raising a ValueError
+    # if it has not been added to this window
+    def _require_index(self, drawable_object, action="change"):
+        position = self._index_map.get(id(drawable_object))
+        if position is None:
             raise ValueError(
-                "Cannot change the layer of an object that has not been added to graphics window"  # noqa: E501
+                "Cannot " + action + " the layer of an object that has not been added to graphics window"  # noqa: E501
             )
-        else:
-            position = self._draw_list.index(drawable_object)
+        return position
+
+    def move_forward(self, drawable_object):
+        position = self._require_index(drawable_object)
 
         if position == len(self._draw_list) - 1:
             return
+        drawable_object._drawn_state = None  # Its area looks different in the new order
 
         # Otherwise, swap positions with object above
         new_position = position + 1
-        swap = self._draw_list[position]
-        self._draw_list[position] = self._draw_list[new_position]
-        self._draw_list[new_position] = swap
+        draw_list = self._draw_list
+        draw_list[position], draw_list[new_position] = draw_list[new_position], draw_list[position]
+        self._index_map[id(draw_list[position])] = position
+        self._index_map[id(draw_list[new_position])] = new_position
 
     def move_to_front(self, drawable_object):
+        position = self._require_index(drawable_object)
 
-        if drawable_object not in self._draw_list:
-            raise ValueError(
-                "Cannot change the layer of an object that has not been added to graphics window"  # noqa: E501
-            )
-
-        self._draw_list.remove(drawable_object)
+        del self._draw_list[position]
         self._draw_list.append(drawable_object)
+        self._reindex_draw_list(position)
+        drawable_object._drawn_state = None
 
     def move_backward(self, drawable_object):
-        if drawable_object not in self._draw_list:
-            raise ValueError(
-                "Cannot change the layer of an object that has not been added to graphics window"  # noqa: E501
-            )
-        else:
-            position = self._draw_list.index(drawable_object)
+        position = self._require_index(drawable_object)
 
         if position == 0:
             return
+        drawable_object._drawn_state = None
 
         new_position = position - 1
-        swap = self._draw_list[position]
-        self._draw_list[position] = self._draw_list[new_position]
-        self._draw_list[new_position] = swap
+        draw_list = self._draw_list
+        draw_list[position], draw_list[new_position] = draw_list[new_position], draw_list[position]
+        self._index_map[id(draw_list[position])] = position
+        self._index_map[id(draw_list[new_position])] = new_position
 
     def move_to_back(self, drawable_object):
-        if drawable_object not in self._draw_list:
-            raise ValueError(
-                "Cannot change the layer of an object that has not been added to graphics window"  # noqa: E501
-            )
+        position = self._require_index(drawable_object)
 
-        self._draw_list.remove(drawable_object)
+        del self._draw_list[position]
         self._draw_list.insert(0, drawable_object)
+        self._reindex_draw_list()
+        drawable_object._drawn_state = None
 
     # Gets layer number (index in draw list; 0 is back layer)
     def get_layer(self, drawable_object):
-        if drawable_object not in self._draw_list:
-            raise ValueError(
-                "Cannot change the layer of an object that has not been added to graphics window"  # noqa: E501
-            )
-        else:
-            return self._draw_list.index(drawable_object)
+        return self._require_index(drawable_object)
 
     # Setting layer puts object at the given index,
     # which places it just behind the object previously
@@ -303,19 +422,23 @@ class GraphicsWindow(object):
     def set_layer(self, drawable_object, layer_index):
         if layer_index < 0:
             raise ValueError("Layer value must be positive")
-        if drawable_object not in self._draw_list:
-            raise ValueError(
-                "Cannot set the layer of an object that has not been added to graphics window"  # noqa: E501
-            )
-
-        self._draw_list.remove(drawable_object)
+        position = self._require_index(drawable_object, "set")
 
         # If the user selects a layer beyond what is in the draw list,
         # just put it on top
-        if layer_index >= len(self._draw_list):
-            self._draw_list.append(drawable_object)
-        else:
-            self._draw_list.insert(layer_index, drawable_object)
+        draw_list = self._draw_list
+        new_position = min(layer_index, len(draw_list) - 1)
+        if new_position == position:
+            return
+
+        del draw_list[position]
+        draw_list.insert(new_position, drawable_object)
+        drawable_object._drawn_state = None
+
+        # Only the objects between the old and new positions have shifted
+        index_map = self._index_map
+        for i in range(min(position, new_position), max(position, new_position) + 1):
+            index_map[id(draw_list[i])] = i
 
     # === Event Loop Management ===
 
@@ -334,29 +457,75 @@ class GraphicsWindow(object):
         self._clock.tick(self.framerate)
 
         # Draw frame
-        destroyed_items = []
-        self._surface.fill(self.background_color)
+        surface = self._surface
+        delta_time = self._clock.get_time()
+        any_destroyed = False
+        surface.fill(self._background_mapped)
+
+        # Only the areas of objects that moved, appeared, disappeared, or changed how
+        # they look need to be pushed to the display, both where they were last frame
+        # and where they are now
+        dirty_rects = self._carried_dirty_rects
+        self._carried_dirty_rects = []
+        update_whole_display = self._background_changed
+
+        # Draw, update, and drop destroyed objects in a single pass over the draw list
+        remaining_items = []
         for drawable_item in self._draw_list:
+            drawn_rect = None
+            drawn_state = None
             if not drawable_item.destroyed:
-                drawable_item._draw()
-            drawable_item._update(self._clock.get_time())
+                if _get_draw_takes_surface(type(drawable_item)):
+                    drawn_rect = drawable_item._draw(surface)
+                else:
+                    drawn_rect = drawable_item._draw()
+                if drawn_rect is None:
+                    if drawable_item.visible:
+                        update_whole_display = True  # Drawn over an unknown area
+                else:
+                    drawn_state = drawable_item._get_draw_state()
 
-            if drawable_item.destroyed:
-                destroyed_items.append(drawable_item)
-        pygame.display.flip()
+            previous_rect = drawable_item._drawn_rect
+            if drawn_rect is None or previous_rect is None:
+                changed = drawn_rect is not previous_rect
+            else:
+                changed = drawn_rect != previous_rect
+            if changed or drawn_state != drawable_item._drawn_state:
+                if previous_rect is not None:
+                    dirty_rects.append(previous_rect)
+                if drawn_rect is not None:
+                    dirty_rects.append(drawn_rect)
+            drawable_item._drawn_rect = drawn_rect
+            drawable_item._drawn_state = drawn_state
+            drawable_item._update(delta_time)
 
-        # Remove destroyed elements
-        for drawable_item in destroyed_items:
-            self._draw_list.remove(drawable_item)
+            if drawable_item.destroyed:
+                any_destroyed = True
+                # Objects destroyed after being drawn this frame still need
+                # their area cleared on the next frame
+                if drawn_rect is not None:
+                    self._carried_dirty_rects.append(drawn_rect)
+            else:
+                remaining_items.append(drawable_item)
+        self._draw_list = remaining_items
+        if any_destroyed:
+            self._index_map = {}
+            self._reindex_draw_list()
+
+        if update_whole_display:
+            # First frame, new background color, or an object drawn over an unknown area
+            pygame.display.flip()
+            self._background_changed = False
+        else:
+            pygame.display.update(dirty_rects)
 
         # Capture events from the current frame
-        global _current_frame_event_list
-        _current_frame_event_list = pygame.event.get()
+        _capture_frame_events()
 
         # Check for QUIT
-        for event in _current_frame_event_list:
-            if event.type == pygame.QUIT:
-                self.is_running = False
+        quit_event_type = pygame.QUIT
+        if any(event.type == quit_event_type for event in _current_frame_event_list):
+            self.is_running = False
 
 
 # Returns the current active GraphicsWindow instance;
@@ -376,12 +545,26 @@ class GraphicalObject(object):
         self.x_speed = 0
         self.y_speed = 0
         self._destroyed = False
-
-    def _draw(self):
+        self._drawn_rect = None  # Area covered on the display last frame, if any
+        self._drawn_state = None  # _get_draw_state() when last drawn; None forces a display update
+
+    # surface is the display surface to draw onto; when omitted the active
+    # window's surface is used.
+    # Returns the pygame.Rect of the area drawn over (empty if nothing was drawn).
+    # A visible object that returns None has drawn over an unknown area, so the
+    # whole display is updated that frame.
+    def _draw(self, surface=None):
         raise NotImplementedError(
             "All GraphicalObjects must have some way of drawing themselves."
         )
 
+    # Returns a value that is equal from one frame to the next only while this object
+    # looks the same, apart from its position. finish_frame only updates the display
+    # where an object moved or its draw state changed. By default an object is treated
+    # as changed every frame.
+    def _get_draw_state(self):
+        return object()
+
     def _update(self, delta_time):
         # Update can be called on all Graphical Objects, but not every object does
         # something
@@ -421,6 +604,7 @@ class RectangularObject(GraphicalObject):
         self._height = height
         self.show_bounds = False
         self.bounds_color = (50, 50, 50)
+        self._rect = pygame.Rect(0, 0, 0, 0)
 
     def _get_center_x(self):
         return self.x + (self.width / 2)
@@ -454,21 +638,92 @@ class RectangularObject(GraphicalObject):
     def height(self):
         return self._height
 
+    # Updates this object's reusable Rect to its current bounds and returns it.
+    # For internal use only where the Rect is not kept: the public rect property
+    # returns a new Rect so callers can hold on to it.
+    def _update_rect(self):
+        # NOTE: pygame.Rect does not support non-integer values.
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y)
+        rect.width = self.width
+        rect.height = self.height
+        return rect
+
     @property
     def rect(self):
-        # NOTE: pygame.Rect does not support non-integer values.
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        return pygame.Rect(self._update_rect())
 
     def is_colliding_rect(self, other_rect_obj):
-        return self.rect.colliderect(other_rect_obj.rect)
+        return self._update_rect().colliderect(other_rect_obj.rect)
 
     def is_colliding_point(self, x, y):
-        return self.rect.collidepoint((x, y))
+        return self._update_rect().collidepoint(x, y)
 
     def _update(self, delta_time):
-        x_speed, y_speed = self.speed
-        self.x += (x_speed / 1000) * delta_time
-        self.y += (y_speed / 1000) * delta_time
+        # Speeds are in pixels per second, delta_time is in milliseconds
+        seconds = delta_time * 0.001
+        self.x += self.x_speed * seconds
+        self.y += self.y_speed * seconds
+
+
+# Loads an image file. Once a GraphicsWindow exists the image is converted to the
+# display's pixel format, so that blitting it every frame does not convert each pixel.
+def _load_image(file_path):
+    image = pygame.image.load(file_path)
+    if _active_window is not None:
+        image = image.convert_alpha()
+    return image
+
+
+# Loaded images, image sheets, and .json meta files, keyed by file path.
+# Images are also keyed by whether they were converted for the display.
+_image_cache = {}
+_image_sheet_cache = {}
+_meta_cache = {}
+_NOT_CACHED = object()
+
+
+# Returns the image at file_path, loading it only the first time it is requested
+def _get_image(file_path):
+    key = (file_path, _active_window is not None)
+    image = _image_cache.get(key)
+    if image is None:
+        image = _load_image(file_path)
+        _image_cache[key] = image
+    return image
+
+
+# Returns an ImageSheet for file_path, slicing the image only the first time it is requested
+def _get_image_sheet(file_path, row_count, column_count):
+    key = (file_path, row_count, column_count, _active_window is not None)
+    image_sheet = _image_sheet_cache.get(key)
+    if image_sheet is None:
+        image_sheet = ImageSheet(file_path, row_count, column_count)
+        _image_sheet_cache[key] = image_sheet
+    return image_sheet
+
+
+# Returns the parsed contents of a .json meta file, or None if there is no such file
+def _get_meta(meta_image_path):
+    meta = _meta_cache.get(meta_image_path, _NOT_CACHED)
+    if meta is _NOT_CACHED:
+        if os.path.isfile(meta_image_path):
+            with open(meta_image_path) as meta_file:
+                meta = json.load(meta_file)
+        else:
+            meta = None
+        _meta_cache[meta_image_path] = meta
+    return meta
+
+
+# Flips an image cell. Flipped copies of loaded cells are shared by every sprite showing
+# the same cell flipped the same way, so identical sprites (tiles, bullets, UI elements)
+# only allocate one flipped surface. Scaled and rotated cells are not shared: scale and
+# angle can take any value, so each sprite keeps its own in _transformed_cells.
+@lru_cache(maxsize=128)
+def _flip_cell_cached(cell, flip_x, flip_y):
+    return pygame.transform.flip(cell, flip_x, flip_y)
 
 
 class Sprite(RectangularObject):
@@ -494,6 +749,8 @@ class Sprite(RectangularObject):
         self._angle = 0
         self._flip_x = False
         self._flip_y = False
+        self._blit_pos = [0, 0]
+        self._pixels_version = 0  # Counts in-place changes to cells, for _get_draw_state
         super().__init__(
             x,
             y,
@@ -518,19 +775,18 @@ class Sprite(RectangularObject):
         # based on the presence of a .json meta file of same name
         image_file_path = image_descriptor
         meta_image_path = image_file_path.split(".")[0] + ".json"
-        try:
-            with open(meta_image_path) as meta_file:
-                size_dict = json.load(meta_file)
+        size_dict = _get_meta(meta_image_path)
+        if size_dict is not None:
             row_count = size_dict["rows"]
             column_count = size_dict["cols"]
-            image_sheet = ImageSheet(image_descriptor, row_count, column_count)
+            image_sheet = _get_image_sheet(image_descriptor, row_count, column_count)
             if (
                 self.image_animation_rate is None
             ):  # if a previous animation rate exists, use that
                 self.image_animation_rate = row_count * column_count
             cells = image_sheet.cells
-        except IOError:
-            cells = [pygame.image.load(image_file_path)]
+        else:
+            cells = [_get_image(image_file_path)]
 
         if not init:
             old_center = self.center
@@ -543,10 +799,14 @@ class Sprite(RectangularObject):
 
         self._image_descriptor = image_descriptor
 
-        # Change cells
+        # Change cells. The loaded cells are shared with every sprite using the same
+        # image, so this sprite keeps its own list and copies a cell before changing it.
         self._current_cell_index = 0
-        self._cells = cells
+        self._shared_cells = cells
+        self._cells = list(cells)
         self._transformed_cells = [None] * len(cells)
+        self._active_cell = None
+        self._update_is_animated()
 
         # Reset cell animation timing
         self._time_current_cell_visible = 0
@@ -570,13 +830,20 @@ class Sprite(RectangularObject):
         return self._cells[self._current_cell_index]
 
     # The current image cell, after scale, flip, and rotate transformations.
+    # Kept in self._active_cell until the cell index or a transformation changes,
+    # so the per-frame draw path only reads one attribute.
     @property
     def _current_transformed_cell(self):
+        active_cell = self._active_cell
+        if active_cell is not None:
+            return active_cell
+
         transformed_cell = self._transformed_cells[self._current_cell_index]
         if transformed_cell is None:  # not yet cached
             cell = self._cells[self._current_cell_index]
             transformed_cell = self._transform_cell(cell)
             self._transformed_cells[self._current_cell_index] = transformed_cell
+        self._active_cell = transformed_cell
         return transformed_cell
 
     # Invalidates all cached transformed image cells.
@@ -584,6 +851,7 @@ class Sprite(RectangularObject):
     def _invalidate_transformed_cells(self):
         for i in range(len(self._transformed_cells)):
             self._transformed_cells[i] = None
+        self._active_cell = None
 
     def _get_image_animation_rate(self):
         return self._image_animation_rate
@@ -607,10 +875,17 @@ class Sprite(RectangularObject):
         # Update image animation rate
         self._image_animation_rate = image_animation_rate
         self._time_per_cell = time_per_cell
+        self._update_is_animated()
 
         # Reset cell animation timing
         self._time_current_cell_visible = 0
 
+    # Caches whether _update can ever advance the current cell.
+    # Should be called whenever the cells or the animation rate change.
+    def _update_is_animated(self):
+        cells = getattr(self, "_cells", ())  # Not yet set while the first image is loading
+        self._is_animated = self._time_per_cell != -1 and len(cells) > 1
+
     image_animation_rate = property(
         _get_image_animation_rate,
         _set_image_animation_rate,
@@ -624,6 +899,12 @@ class Sprite(RectangularObject):
     )
 
     def _transform_cell(self, cell):
+        if self._scale == 1.0 and self._angle == 0:
+            if not self._flip_x and not self._flip_y:
+                return cell
+            if cell is self._shared_cells[self._current_cell_index]:
+                return _flip_cell_cached(cell, self._flip_x, self._flip_y)
+
         transformed_cell = cell
 
         # Scale
@@ -648,6 +929,24 @@ class Sprite(RectangularObject):
 
         return transformed_cell
 
+    # The current transformed cell, safe to modify in place. Loaded cells and their
+    # flipped copies are shared with other sprites, so a shared one is first replaced
+    # with a private copy for this sprite. Scaled or rotated cells are already private.
+    def _get_writable_transformed_cell(self):
+        self._pixels_version += 1  # The caller is about to change the cell's pixels
+        index = self._current_cell_index
+        transformed_cell = self._current_transformed_cell
+        cell = self._cells[index]
+        if cell is self._shared_cells[index] and self._scale == 1.0 and self._angle == 0:
+            if transformed_cell is cell:
+                transformed_cell = cell.copy()
+                self._cells[index] = transformed_cell
+            else:
+                transformed_cell = transformed_cell.copy()
+            self._transformed_cells[index] = transformed_cell
+            self._active_cell = transformed_cell
+        return transformed_cell
+
     @property
     def width(self):
         return self._current_transformed_cell.get_width()
@@ -732,27 +1031,23 @@ class Sprite(RectangularObject):
         if _query_ui:
             return _query_ui('surfarray_ts_array3d', [active_surface._id])
 
-        int_array = pygame.surfarray.array2d(active_surface)
-        width, height = active_surface.get_size()
-        rgba_array = [None] * width
-
-        for x in range(width):
-            rgba_array[x] = [None] * height
+        import numpy  # Local import: pygame.surfarray already requires numpy off-platform
 
-            for y in range(height):
-                int_color = int_array[x][y]
-                rgba_color = active_surface.unmap_rgb(int_color)
-                # Typecasting to list for return type consistency with in-platform implementation
-                rgba_array[x][y] = list(rgba_color)
+        # Read all RGB values and the alpha channel in bulk (alpha is 255 for surfaces
+        # without per-pixel alpha), then stack them into a (width, height, 4) array
+        rgb_array = pygame.surfarray.array3d(active_surface)
+        alpha_array = pygame.surfarray.array_alpha(active_surface)
+        rgba_array = numpy.concatenate((rgb_array, alpha_array[..., numpy.newaxis]), axis=2)
 
-        return rgba_array
+        # Converting to nested lists for return type consistency with in-platform implementation
+        return rgba_array.tolist()
 
     def set_pixels(self, rgba_array):
         # Type & value checking of outer list
         if not isinstance(rgba_array, (list, tuple)):
             raise TypeError("set_pixels expects a 2D list of RGBA tuples (got " + str(type(rgba_array)) + ")")
 
-        active_surface = self._current_transformed_cell
+        active_surface = self._get_writable_transformed_cell()
         width, height = active_surface.get_size()
 
         if len(rgba_array) != width:
@@ -788,8 +1083,17 @@ class Sprite(RectangularObject):
             active_surface._id = _query_ui('surfarray_ts_blit_array3d', [active_surface._id, rgba_array])
             return
 
-        # Int array construction
-        int_array = [None] * width
+        if self._set_pixels_from_array(active_surface, rgba_array):
+            return
+
+        # Fallback for input that is not a uniform grid of integer colors (such as
+        # a mix of RGB and RGBA values) or surfaces that cannot be viewed as RGB arrays.
+        # Also produces the detailed error message for invalid input.
+        # Int array construction; blit_array needs an array, not a list of lists
+        import numpy  # Local import: pygame.surfarray already requires numpy off-platform
+
+        map_rgb = active_surface.map_rgb
+        int_array = numpy.empty((width, height), dtype=numpy.uint32)
         for x in range(width):
 
             # Type & value checking of inner list
@@ -805,9 +1109,8 @@ class Sprite(RectangularObject):
                         height) + ", got height " + str(len(column)) + ")")
 
             # Inner list construction
-            int_array[x] = [None] * height
-            for y in range(height):
-                rgba_color = rgba_array[x][y]
+            int_column = [None] * height
+            for y, rgba_color in enumerate(column):
 
                 # Type & value checking of colors
                 if not isinstance(rgba_color, (list, tuple)):
@@ -819,11 +1122,58 @@ class Sprite(RectangularObject):
                     if not isinstance(value, int) or not (0 <= value <= 255):
                         raise ValueError("Color values must contain only integers between 0 and 255 (got " + str(value) + ")")
 
-                # Final color construction
-                int_color = active_surface.map_rgb(rgba_color)
-                int_array[x][y] = int_color
+                # Final color construction; map_rgb returns a signed value for
+                # surfaces with an alpha mask, so keep its low 32 bits as unsigned
+                int_column[y] = map_rgb(rgba_color) & 0xFFFFFFFF
+            int_array[x] = int_column
+
+        pygame.surfarray.blit_array(active_surface, int_array)
+
+    # Vectorized version of set_pixels for a uniform (width, height, 3 or 4) grid of integer
+    # colors. Returns False without changing the surface if the input or surface format
+    # is not supported, in which case the caller should use the per-pixel path.
+    def _set_pixels_from_array(self, active_surface, rgba_array):
+        # Palette (8-bit) surfaces cannot be packed from channel shifts
+        if active_surface.get_bitsize() not in (16, 24, 32):
+            return False
+
+        import numpy  # Local import: pygame.surfarray already requires numpy off-platform
+
+        try:
+            color_array = numpy.array(rgba_array)
+        except ValueError:  # Ragged input
+            return False
+
+        if (
+            color_array.ndim != 3
+            or color_array.shape[:2] != active_surface.get_size()
+            or not (3 <= color_array.shape[2] <= 4)
+            or color_array.dtype.kind not in "iu"
+        ):
+            return False
+
+        out_of_range = (color_array < 0) | (color_array > 255)
+        if out_of_range.any():
+            value = color_array[out_of_range][0]
+            raise ValueError("Color values must contain only integers between 0 and 255 (got " + str(value) + ")")
+
+        # Pack every color into the surface's pixel format at once, the same way
+        # map_rgb does for a single color (RGB colors are fully opaque)
+        r_shift, g_shift, b_shift, a_shift = active_surface.get_shifts()
+        r_loss, g_loss, b_loss, a_loss = active_surface.get_losses()
+        channels = color_array.astype(numpy.uint32)
+
+        int_array = (
+            ((channels[..., 0] >> r_loss) << r_shift)
+            | ((channels[..., 1] >> g_loss) << g_shift)
+            | ((channels[..., 2] >> b_loss) << b_shift)
+        )
+        if active_surface.get_masks()[3]:
+            alpha = channels[..., 3] if channels.shape[2] == 4 else 255
+            int_array |= (alpha >> a_loss) << a_shift
 
         pygame.surfarray.blit_array(active_surface, int_array)
+        return True
 
     # === Behavior ===
 
@@ -835,6 +1185,10 @@ class Sprite(RectangularObject):
         * delta_time -- The amount of time since the last call to update,
                         in milliseconds.
         """
+        # Fast path for sprites that neither move nor animate, such as most UI images
+        if not self._is_animated and not self.x_speed and not self.y_speed:
+            return
+
         super()._update(delta_time)
         self._time_current_cell_visible += delta_time
 
@@ -848,26 +1202,50 @@ class Sprite(RectangularObject):
                 self._current_cell_index += 1
                 if self._current_cell_index == len(self._cells):
                     self._current_cell_index = 0
+                self._active_cell = None
         else:
             # Time per cell is X seconds/cell
             time_per_cell = self._time_per_cell
 
             # Change current cell if enough time has passed
             if self._time_current_cell_visible >= time_per_cell:
-                (num_cells_to_advance, self._time_current_cell_visible) = divmod(
-                    self._time_current_cell_visible, time_per_cell
-                )
+                # Usually exactly one cell has elapsed; only use divmod after long frames
+                self._time_current_cell_visible -= time_per_cell
+                num_cells_to_advance = 1
+                if self._time_current_cell_visible >= time_per_cell:
+                    (extra_cells, self._time_current_cell_visible) = divmod(
+                        self._time_current_cell_visible, time_per_cell
+                    )
+                    num_cells_to_advance += int(extra_cells)
                 self._current_cell_index = (
-                    self._current_cell_index + int(num_cells_to_advance)
+                    self._current_cell_index + num_cells_to_advance
                 ) % len(self._cells)
+                self._active_cell = None
 
-    def _draw(self):
-        """Draws this sprite if it is visible."""
+    def _draw(self, surface=None):
+        """Draws this sprite onto the given surface if it is visible."""
+        if surface is None:
+            surface = _get_window()._surface
+
+        drawn_rect = None
         if self.visible:
-            _get_window()._surface.blit(self._current_transformed_cell, [self.x, self.y])
+            active_cell = self._active_cell
+            if active_cell is None:
+                active_cell = self._current_transformed_cell
+            # Reuse one position list rather than allocating a new one every frame
+            blit_pos = self._blit_pos
+            blit_pos[0] = self.x
+            blit_pos[1] = self.y
+            drawn_rect = surface.blit(active_cell, blit_pos)
 
         if self.show_bounds:
-            pygame.draw.rect(_get_window()._surface, self.bounds_color, self.rect, width=2)
+            bounds_rect = pygame.draw.rect(surface, self.bounds_color, self._update_rect(), width=2)
+            drawn_rect = bounds_rect if drawn_rect is None else drawn_rect.union(bounds_rect)
+
+        return drawn_rect
+
+    def _get_draw_state(self):
+        return (self._current_transformed_cell, self._pixels_version, self.show_bounds, self.bounds_color)
 
 
 class ImageSheet(object):
@@ -882,7 +1260,7 @@ class ImageSheet(object):
         if not (row_count >= 1 and column_count >= 1):
             raise ValueError("Expected row and column count to be >= 1.")
 
-        sheet_image = pygame.image.load(file_path)
+        sheet_image = _load_image(file_path)
         sheet_width, sheet_height = sheet_image.get_size()
 
         # Slice the sheet into cells
@@ -905,6 +1283,59 @@ class ImageSheet(object):
         self.column_count = column_count
 
 
+# Loads a font at a given size. Fonts are shared by every TextLabel using the same font
+# and size, so each font file is only opened once per size. Shared fonts must not be
+# changed: a TextLabel's color is passed in when it renders instead of set on the font.
+@lru_cache(maxsize=64)
+def _load_font(font_name, font_size):
+    font = _get_freetype().Font(font_name, font_size)
+    font.origin = True
+    return font
+
+
+# Returns the pixel width of a word or line of text in a font at a given size. Widths
+# are shared by every TextLabel, so each distinct string is only measured once per
+# font and size.
+@lru_cache(maxsize=4096)
+def _text_width(font_name, font_size, text):
+    return _load_font(font_name, font_size).get_rect(text).width
+
+
+# Returns the height of a line of text in a font at a given size, measured from all the
+# letters, digits, and common symbols. Shared by every TextLabel using the same font and
+# size, so the sample is only laid out once per font and size.
+@lru_cache(maxsize=64)
+def _text_line_height(font_name, font_size):
+    full_alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwkxyz!?0123456789/@#$%^&*()"
+    return _load_font(font_name, font_size).get_rect(full_alphabet).height
+
+
+# Renders one line of text. Results are shared by every TextLabel drawing the same line
+# with the same font and color, so repeated text is only rasterized once.
+# Returns the rendered surface and the offset of its top left corner from the text origin.
+@lru_cache(maxsize=256)
+def _render_line_cached(font, color, line):
+    line_surface, line_rect = font.render(line, fgcolor=color)
+    return line_surface, line_rect.x, -line_rect.y
+
+
+# Return the x position of a line of text with the given pixel width, in a text box
+# starting at start_x with width box_width. TextLabel keeps the one for its alignment.
+def _align_left_x(start_x, box_width, line_width):
+    return start_x
+
+
+def _align_right_x(start_x, box_width, line_width):
+    return (start_x + box_width) - line_width
+
+
+def _align_center_x(start_x, box_width, line_width):
+    return start_x + (box_width / 2) - (0.5 * line_width)
+
+
+_align_x_functions = {"left": _align_left_x, "right": _align_right_x, "center": _align_center_x}
+
+
 class TextLabel(RectangularObject):
     """
     A text label that wraps and uses baseline position.
@@ -922,15 +1353,20 @@ class TextLabel(RectangularObject):
         if not isinstance(width, (int, float)):
             raise TypeError("TextLabel width must be an integer" + correct_args)
 
-        self._font = pygame.freetype.Font(font_name, font_size)
+        self._font = _load_font(font_name, font_size)
         self._font_identifier = font_name
-        self._font.origin = True
-        self._font.fgcolor = color
+        self._color = pygame.Color(color)
+        self._color_key = tuple(self._color)  # Hashable form of the color, for _render_line_cached
         self.position = (x, y)
         self._width = width
         self._text = str(text)
-        self._wrap_into_lines()  # Creates self._lines list
+        self._line_surface_cache = {}  # Rendered lines of the current text, see _get_line_surface
+        self._underline_key = None  # What self._underline_surface shows, see _get_underline_surface
+        self._underline_surface = None
+        self._update_font_metrics()
+        self._lines_dirty = True  # self._lines is created when first needed, see _ensure_lines
         self._align = "left"
+        self._x_of = _align_left_x
         self._set_line_spacing(1.2)
         super().__init__(x, y, self.width, self.height)
         self.bounds_color = self.color
@@ -940,7 +1376,8 @@ class TextLabel(RectangularObject):
 
     def _set_text(self, text_string):  # Setting text causes re-calculation of wrapping
         self._text = str(text_string)
-        self._wrap_into_lines()
+        self._line_surface_cache.clear()
+        self._lines_dirty = True
 
     text = property(_get_text, _set_text)
 
@@ -949,25 +1386,31 @@ class TextLabel(RectangularObject):
 
     def _set_width(self, new_width):  # Setting width causes re-calculation of wrapping
         self._width = new_width
-        self._wrap_into_lines()
+        self._lines_dirty = True
 
     width = property(_get_width, _set_width)
 
     @property
     def height(self):
+        self._ensure_lines()
         return self._pixel_line_height * len(self._lines)
 
-    @property
-    def rect(self):
+    def _update_rect(self):
         # NOTE: pygame.Rect does not support non-integer values for position
-        return pygame.Rect(int(self.x), int(self.y - self._font.get_sized_ascender()), int(self.width), int(self.height))
+        rect = self._rect
+        rect.x = int(self.x)
+        rect.y = int(self.y - self._ascender)
+        rect.width = int(self.width)
+        rect.height = int(self.height)
+        return rect
 
     def _get_align(self):
         return self._align
 
     def _set_align(self, alignment):
         alignment = alignment.lower()
-        if alignment != "right" and alignment != "left" and alignment != "center":
+        x_of = _align_x_functions.get(alignment)
+        if x_of is None:
             raise ValueError(
                 'Text Label alignment must be "left", "right", or "center": got "'
                 + str(alignment)
@@ -975,6 +1418,7 @@ class TextLabel(RectangularObject):
             )
         else:
             self._align = alignment
+            self._x_of = x_of
 
     align = property(_get_align, _set_align)
 
@@ -982,21 +1426,24 @@ class TextLabel(RectangularObject):
         return self._font_identifier
 
     def _set_font(self, font_name):
-        new_font = pygame.freetype.Font(
-            font_name, self.font_size
-        )  # Setting font causes re-calculation of wrapping and line height
-        new_font.fgcolor = self.color
-        new_font.origin = True
-        self._font = new_font
-        self._wrap_into_lines()
+        # Setting font causes re-calculation of wrapping and line height
+        self._font = _load_font(font_name, self.font_size)
         self._font_identifier = font_name
+        self._line_surface_cache.clear()
+        self._update_font_metrics()
+        self._lines_dirty = True
+        self._line_height_dirty = True
 
     font = property(_get_font, _set_font)
 
+    # Resets the measurements that depend on the font and font size
+    def _update_font_metrics(self):
+        self._space_width = self._font.get_rect(" ").width
+        self._ascender = self._font.get_sized_ascender()
+
     def _update_pixel_line_height(self):
         # Test all letters in font to get line height
-        full_alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwkxyz!?0123456789/@#$%^&*()"
-        self._pixel_line_height = self._font.get_rect(full_alphabet).height * self._line_spacing
+        self._pixel_line_height = _text_line_height(self._font_identifier, self._font.size) * self._line_spacing
 
     def _get_font_size(self):
         return self._font.size
@@ -1004,9 +1451,11 @@ class TextLabel(RectangularObject):
     def _set_font_size(
         self, new_size
     ):  # Setting font size causes re-calculation of wrapping and line height
-        self._font.size = new_size
-        self._wrap_into_lines()
-        self._update_pixel_line_height()
+        self._font = _load_font(self._font_identifier, new_size)
+        self._line_surface_cache.clear()
+        self._update_font_metrics()
+        self._lines_dirty = True
+        self._line_height_dirty = True
 
     font_size = property(_get_font_size, _set_font_size)
 
@@ -1015,17 +1464,19 @@ class TextLabel(RectangularObject):
 
     def _set_line_spacing(self, spacing):
         self._line_spacing = spacing
-        self._update_pixel_line_height()
+        self._line_height_dirty = True
 
     line_spacing = property(_get_line_spacing, _set_line_spacing)
 
     def _get_color(self):
-        return self._font.fgcolor
+        return self._color
 
     def _set_color(self, new_color):
         if self.bounds_color == self.color:
             self.bounds_color = new_color
-        self._font.fgcolor = new_color
+        self._color = pygame.Color(new_color)
+        self._color_key = tuple(self._color)
+        self._line_surface_cache.clear()
 
     color = property(_get_color, _set_color)
 
@@ -1063,39 +1514,105 @@ class TextLabel(RectangularObject):
 
     # === Override Methods ===
 
-    def _draw(self):
-        if self.visible:
+    def _draw(self, surface=None):
+        if surface is None:
             surface = _get_window()._surface
-            start_x, y = self.position
-            for line in self._lines:
-                line_width = self._font.get_rect(line).width
-
-                if self.align == "left":
-                    x = start_x
 
-                elif self.align == "right":
-                    x = (start_x + self.width) - line_width
+        # Nothing is drawn for an empty label, not even its bounds
+        if not self._text:
+            return pygame.Rect(int(self.x), int(self.y), 0, 0)
+
+        if not self.visible:
+            if self.show_bounds:
+                return pygame.draw.rect(surface, self.bounds_color, self._update_rect(), width=2)
+            return None
+
+        self._ensure_lines()
+
+        # Everything the line loop reads is looked up once, before the loop
+        x_of = self._x_of
+        get_line_surface = self._get_line_surface
+        start_x, y = self.position
+        box_width = self._width
+        line_height = self._pixel_line_height
+        drawn_rects = []
+        blit_sequence = []
+        baselines = []
+        for line, line_width in self._lines:
+            x = x_of(start_x, box_width, line_width)
+            line_surface, offset_x, offset_y = get_line_surface(line)
+            destination = (int(x + offset_x), int(y + offset_y))
+            blit_sequence.append((line_surface, destination))
+            drawn_rects.append(line_surface.get_rect(topleft=destination))
+            baselines.append(y)
+            y += line_height
+
+        # All lines are blitted in one call; the drawn rects are worked out above
+        # from the line surfaces, so blits does not need to build its own list
+        surface.blits(blit_sequence, doreturn=0)
 
-                elif self.align == "center":
-                    x = start_x + (self.width / 2) - (0.5 * line_width)
-
-                else:
-                    raise AssertionError(
-                        'Text Label alignment must be "left", "right", or "center": got "'  # noqa: E501
-                        + self.align
-                        + '"'
-                    )
-
-                self._font.render_to(surface, (x, y), line)
-                if self.show_bounds and self.text != "":
-                    pygame.draw.line(surface, self.bounds_color, (self.x, y), (self.x + self.width, y), width=1)
-                y += self._pixel_line_height
+        if self.show_bounds:
+            bounds_color = self.bounds_color
+            underline_surface = self._get_underline_surface(baselines, box_width, bounds_color)
+            drawn_rects.append(surface.blit(underline_surface, (int(start_x), int(baselines[0]))))
+            drawn_rects.append(pygame.draw.rect(surface, bounds_color, self._update_rect(), width=2))
+
+        return drawn_rects[0].unionall(drawn_rects[1:])
+
+    def _get_draw_state(self):
+        return (
+            self._text,
+            self._font,
+            self._color_key,
+            self._align,
+            self._width,
+            self._line_spacing,
+            self.show_bounds,
+            self.bounds_color,
+        )
 
-        if self.show_bounds and self.text != "":
-            pygame.draw.rect(_get_window()._surface, self.bounds_color, self.rect, width=2)
+    # Returns the rendered surface for a line of this label's text and the offset of its
+    # top left corner from the line's baseline position. Cleared whenever the text, font,
+    # font size, or color changes.
+    def _get_line_surface(self, line):
+        cached = self._line_surface_cache.get(line)
+        if cached is None:
+            cached = _render_line_cached(self._font, self._color_key, line)
+            self._line_surface_cache[line] = cached
+        return cached
+
+    # Returns a transparent surface with a bounds underline for each baseline drawn on it,
+    # with its top left corner at the first baseline. The surface is kept and only drawn
+    # again when the label's width, line positions, or bounds color change.
+    def _get_underline_surface(self, baselines, box_width, bounds_color):
+        first_baseline = int(baselines[0])
+        key = (
+            int(box_width),
+            tuple(int(y) - first_baseline for y in baselines),
+            tuple(pygame.Color(bounds_color)),
+        )
+        if key != self._underline_key:
+            underline_width, offsets, color = key
+            underline_surface = pygame.Surface((underline_width + 1, offsets[-1] + 1), pygame.SRCALPHA)
+            for offset in offsets:
+                pygame.draw.line(underline_surface, color, (0, offset), (underline_width, offset), width=1)
+            self._underline_surface = underline_surface
+            self._underline_key = key
+        return self._underline_surface
 
     # === Text Wrapping ===
 
+    # Setters only mark the wrapped lines and line height as out of date, so that
+    # changing several properties in a row only wraps the text once, when the
+    # lines are next drawn or measured
+    def _ensure_lines(self):
+        if self._lines_dirty:
+            self._wrap_into_lines()
+            self._lines_dirty = False
+        if self._line_height_dirty:
+            self._update_pixel_line_height()
+            self._line_height_dirty = False
+
     def _wrap_into_lines(self):
         """
         Creates a list of lines of text based on the width of
@@ -1103,43 +1620,61 @@ class TextLabel(RectangularObject):
         (Does not hyphenate; if the length of any one word
         exceeds the text box width, that word is given its
         own line)
+        Each line is stored with its measured pixel width, for alignment
         """
 
+        from bisect import bisect_right  # Local import: only needed once text is wrapped
+
+        font_name = self._font_identifier
+        font_size = self._font.size
+        space_width = self._space_width
         total_lines = []
-        hard_lines = self._text.split("\n")
+        hard_lines = self._text.splitlines() or [""]
 
         for line in hard_lines:
-            words = line.split(" ")
-            intermediate_line = ""
-
+            words = line.split() or [""]  # Runs of spaces are one break; a blank line stays a line
+
+            # Note: PyGame returns different widths for a full string than for the sum
+            # of its parts, so the sum of the word and space widths is only used to
+            # guess where each line breaks. The guess is then checked by measuring the
+            # assembled line, which is what decides whether it fits.
+            # ends[i] is the width of words[0:i] plus one trailing space per word, so
+            # words[start:end] are estimated to fit on a line when
+            # ends[end] - ends[start] - space_width is no wider than the text box.
+            ends = [0]
+            total_width = 0
             for word in words:
-
-                # Note: in order for PyGame to correctly calculate width, string MUST be assembled
-                # as you go: PyGame returns different width calculates for the full string than it
-                # does for the sum of the individual parts
-                if intermediate_line == "":
-                    next_width = self._font.get_rect(word).width
-                else:
-                    next_width = self._font.get_rect(intermediate_line + " " + word).width
-
-                # Next word will not fit on line
-                if next_width > self._width:
-
-                    if intermediate_line == "":  # Handles individual words wider than the text box
-                        intermediate_line = word
-                        total_lines.append(intermediate_line)
-                        intermediate_line = ""
-                        continue
-
-                    total_lines.append(intermediate_line)  # Appends full-length line
-                    intermediate_line = ""
-
-                if intermediate_line == "":
-                    intermediate_line += word
+                total_width += _text_width(font_name, font_size, word) + space_width
+                ends.append(total_width)
+
+            start = 0
+            word_count = len(words)
+            while start < word_count:
+                end = bisect_right(ends, ends[start] + self._width + space_width) - 1
+                if end <= start:  # Handles individual words wider than the text box
+                    end = start + 1
+
+                # Confirm the guessed break against the assembled line: move it back a word
+                # at a time while the line is too wide, or forward while the next word fits
+                line_text = " ".join(words[start:end])
+                line_width = _text_width(font_name, font_size, line_text)
+                if line_width > self._width:
+                    while end - start > 1 and line_width > self._width:
+                        end -= 1
+                        line_text = " ".join(words[start:end])
+                        line_width = _text_width(font_name, font_size, line_text)
                 else:
-                    intermediate_line += " " + word
-
-            total_lines.append(intermediate_line)  # Appends final partial line
+                    while end < word_count:
+                        next_text = line_text + " " + words[end]
+                        next_width = _text_width(font_name, font_size, next_text)
+                        if next_width > self._width:
+                            break
+                        line_text = next_text
+                        line_width = next_width
+                        end += 1
+
+                total_lines.append((line_text, line_width))
+                start = end
         self._lines = total_lines
 
 
@@ -1148,12 +1683,36 @@ class TextLabel(RectangularObject):
 
 class Sound(object):
     def __init__(self, filename, looping=False, unique=False):
+        _init_pygame()
         self._pygame_sound = pygame.mixer.Sound(filename)
         self._looping = looping
         self._paused = False
+        self._channels = []  # Channels this sound was played on, see _get_live_channels
         self.unique = unique
         self.caption = filename  # Filename by default, but can be overwritten with descriptive text such as "BOOM!"
 
+    @property
+    def caption(self):
+        return self._caption
+
+    @caption.setter
+    def caption(self, value):
+        self._caption = value
+        # The (short, long) caption printed for each action, built once per caption
+        text = str(value)
+        self._action_captions = {
+            "play": (text, "[SOUND] " + text + " [plays]"),
+            "stop": (text + " stops", "[SOUND] " + text + " [stops]"),
+            "pause": (text + " pauses", "[SOUND] " + text + " [pauses]"),
+            "unpause": (text + " unpauses", "[SOUND] " + text + " [unpauses]"),
+        }
+
+    # Prints the caption for an action when captions are on
+    def _print_caption(self, action):
+        if captions_on:
+            short_caption, long_caption = self._action_captions[action]
+            print(short_caption if captions_short else long_caption)
+
     @property
     def paused(self):
         return self._paused
@@ -1168,21 +1727,18 @@ class Sound(object):
             raise ValueError("Sound volume must be a float from 0 to 1 (got " + str(value) + ")")
 
         if captions_on:
-            caption_text = ""
+            current_volume = self._pygame_sound.get_volume()
+            if value < current_volume:
+                change = "gets quieter"
+            elif value > current_volume:
+                change = "gets louder"
+            else:
+                change = "stays the same volume"
+
             if captions_short:
-                if value < self.volume:
-                    caption_text += self.caption + " gets quieter"
-                elif value > self.volume:
-                    caption_text += self.caption + " gets louder"
-                else:
-                    caption_text += self.caption + " stays the same volume"
+                caption_text = self.caption + " " + change
             else:
-                if value < self.volume:
-                    caption_text += "[SOUND] " + self.caption + " [gets quieter (" + str(value) + ")]"
-                elif value > self.volume:
-                    caption_text += "[SOUND] " + self.caption + " [gets louder (" + str(value) + ")]"
-                else:
-                    caption_text += "[SOUND] " + self.caption + " [stays the same volume (" + str(value) + ")]"
+                caption_text = "[SOUND] " + self.caption + " [" + change + " (" + str(value) + ")]"
 
             if self.get_num_copies() == 0:
                 caption_text += " (no audio: no copies of this sound are playing)"
@@ -1221,81 +1777,71 @@ class Sound(object):
             return False
 
         num_loops = -1 if self.looping else 0
-        self._pygame_sound.play(loops=num_loops)
-        if captions_on:
-            if captions_short:
-                print(self.caption)
-            else:
-                print("[SOUND] " + self.caption + " [plays]")
+        channel = self._pygame_sound.play(loops=num_loops)
+        if channel is not None:
+            self._get_live_channels().append(channel)
+        self._print_caption("play")
         return True
 
     def stop(self):
         self._pygame_sound.stop()
+        self._channels = []
         self._paused = False
-
-        if captions_on:
-            if captions_short:
-                print(self.caption + " stops")
-            else:
-                print("[SOUND] " + self.caption + " [stops]")
+        self._print_caption("stop")
 
     def pause(self):
-        for i in range(pygame.mixer.get_num_channels()):
-            current_channel = pygame.mixer.Channel(i)
-            if current_channel.get_sound() == self._pygame_sound:
-                current_channel.pause()
+        for current_channel in self._get_live_channels():
+            current_channel.pause()
 
         self._paused = True
-        if captions_on:
-            if captions_short:
-                print(self.caption + " pauses")
-            else:
-                print("[SOUND] " + self.caption + " [pauses]")
+        self._print_caption("pause")
 
     def unpause(self):
-        for i in range(pygame.mixer.get_num_channels()):
-            current_channel = pygame.mixer.Channel(i)
-            if current_channel.get_sound() == self._pygame_sound:
-                current_channel.unpause()
+        for current_channel in self._get_live_channels():
+            current_channel.unpause()
         self._paused = False
-        if captions_on:
-            if captions_short:
-                print(self.caption + " unpauses")
-            else:
-                print("[SOUND] " + self.caption + " [unpauses]")
+        self._print_caption("unpause")
 
     def get_num_copies(self):
         return self._pygame_sound.get_num_channels()
 
+    # Returns the channels from play() that still have this sound on them, dropping
+    # those that have finished or been taken over by another sound. This avoids
+    # checking every mixer channel to find the ones playing this sound.
+    def _get_live_channels(self):
+        pygame_sound = self._pygame_sound
+        self._channels = [channel for channel in self._channels if channel.get_sound() is pygame_sound]
+        return self._channels
+
 
 # ------------------------------------------------------------------------------
 # Interaction
 
+# Returns pygame.key.get_pressed() for the current frame. The keyboard state only
+# changes when events are processed, so it is fetched at most once per frame.
+def _get_pressed_keys():
+    global _current_frame_pressed_keys
+    if _current_frame_pressed_keys is None:
+        _current_frame_pressed_keys = pygame.key.get_pressed()
+    return _current_frame_pressed_keys
+
+
 def is_key_down(key_constant=None):
     if not key_constant:
-        for key_down in pygame.key.get_pressed():
-            if key_down:
-                return True
-        return False
-    return pygame.key.get_pressed()[key_constant]
+        return any(_get_pressed_keys())
+    return _get_pressed_keys()[key_constant]
 
 
 def was_key_pressed(key_constant=None):
-    global _current_frame_event_list
-    for event in _current_frame_event_list:
-        if event.type == pygame.KEYDOWN:
-            if (key_constant and event.key == key_constant) or not key_constant:
-                return True
-    return False
+    if not key_constant:
+        return bool(_current_frame_key_downs)
+    return key_constant in _current_frame_key_downs
 
 
 def was_key_released(key_constant=None):
-    global _current_frame_event_list
-    for event in _current_frame_event_list:
-        if event.type == pygame.KEYUP:
-            if (key_constant and event.key == key_constant) or not key_constant:
-                return True
-    return False
+    if not key_constant:
+        return bool(_current_frame_key_ups)
+    return key_constant in _current_frame_key_ups
 
 
 def is_mouse_down():
@@ -1303,19 +1849,11 @@ def is_mouse_down():
 
 
 def was_mouse_pressed():
-    global _current_frame_event_list
-    for event in _current_frame_event_list:
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            return True
-    return False
+    return _current_frame_mouse_down
 
 
 def was_mouse_released():
-    global _current_frame_event_list
-    for event in _current_frame_event_list:
-        if event.type == pygame.MOUSEBUTTONUP:
-            return True
-    return False
+    return _current_frame_mouse_up
 
 
 def get_mouse_x():